@@ -0,0 +1,83 @@
+# api/_debug.py
+# Debug output for the calendar endpoint, only imported when ?debug=true is requested.
+# The leading underscore stops Vercel from exposing this file as its own endpoint.
+#
+# The parsing helpers are passed in by api/calendar.py rather than imported from it:
+# Vercel loads that file by path, so "import api.calendar" would load a second copy
+# with its own session, caches and locks.
+
+def generate_debug_info(schedule_data, weeks_ahead, events, now, *, parse_week_date,
+                        parse_time_slots, extract_special_notes, day_names, event_summary):
+    """Generate detailed debug information for troubleshooting"""
+    debug_info = {
+        "schedule_data": schedule_data,
+        "parsing_results": {},
+        "calendar_events": [],
+        "issues_found": []
+    }
+    
+    # Report how each week title parsed
+    for week_title in schedule_data:
+        week_start_date = parse_week_date(week_title, now)
+        
+        debug_info["parsing_results"][week_title] = {
+            "week_start_date": week_start_date,
+            "days": {}
+        }
+        
+        if not week_start_date:
+            debug_info["issues_found"].append(f"Could not parse week date: {week_title}")
+    
+    # Then show parsing details for each day of the weeks that did parse
+    for week_title, event_date, day_name, times_str in events:
+        # Parse time slots and show details
+        time_slots = parse_time_slots(times_str)
+        special_notes = extract_special_notes(times_str)
+        # Formatted once for all the day's events
+        event_date_str = event_date.date().isoformat()
+        
+        day_debug = {
+            "original_text": times_str,
+            "parsed_slots": time_slots,
+            "special_notes": special_notes,
+            "event_date": event_date,
+            "day_of_week": day_names[event_date.weekday()]
+        }
+        
+        debug_info["parsing_results"][week_title]["days"][day_name] = day_debug
+        
+        # Check for specific issues
+        if day_name == "Friday" and "07:00-14:00 16:00-21:00" in times_str:
+            if len(time_slots) != 2:
+                debug_info["issues_found"].append(
+                    f"Friday parsing issue: expected 2 slots, got {len(time_slots)} for '{times_str}'"
+                )
+        
+        # Generate events for this day
+        for slot_index, (start_time, end_time) in enumerate(time_slots):
+            summary = event_summary
+            if len(time_slots) > 1:
+                summary += f" (Session {slot_index + 1})"
+            
+            event = {
+                "date": event_date_str,
+                "day_name": day_name,
+                "start_time": start_time,
+                "end_time": end_time,
+                "summary": summary,
+                "session_number": slot_index + 1,
+                "total_sessions": len(time_slots),
+                "original_text": times_str,
+                "special_notes": special_notes
+            }
+            
+            debug_info["calendar_events"].append(event)
+    
+    # Add summary statistics
+    debug_info["summary"] = {
+        "total_weeks": len(schedule_data),
+        "total_events": len(debug_info["calendar_events"]),
+        "issues_count": len(debug_info["issues_found"])
+    }
+    
+    return debug_info
@@ -2,12 +2,117 @@
 from http.server import BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import gzip
+import hashlib
 import json
+from functools import lru_cache
+import sys
+import threading
+import time
+
+# How long a scraped schedule is reused before the website is fetched again
+SCHEDULE_CACHE_SECONDS = 15 * 60
+
+_schedule_cache = None  # (fetched_at, schedule_data, schedule_version, changed_at)
+_schedule_cache_lock = threading.Lock()
+# Held while scraping so concurrent cache misses share a single fetch
+_scrape_lock = threading.Lock()
+
+# (ics_bytes, gzip_bytes, etag) keyed on (schedule_version, name, notes, weeks)
+ICS_CACHE_SIZE = 64
+_ics_cache = {}
+_ics_cache_lock = threading.Lock()
+
+SCHEDULE_URL = "https://www.better.org.uk/leisure-centre/lee-valley/velopark/road-cycling"
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Regexes used by the parsers, compiled once at import
+_WS_RE = re.compile(r'\s+')
+# "Day - times", "Day-times" and "Day -times" in one pattern
+_DAY_TIME_RE = re.compile(r'^([A-Za-z]+)\s*-\s*(.+?)\s*$')
+_WEEK_RE = re.compile(r'Week beginning (\d+) (\w+)', re.IGNORECASE)
+_CLOSED_RE = re.compile(r'closed', re.IGNORECASE)
+_TIME_RANGE_RE = re.compile(r'(\d{2}:\d{2})\s*-\s*(\d{2}:\d{2})')
+_NOTES_RE = re.compile(r'\([^)]+\)')
+_BRACKET_RE = re.compile(r'[()]')
+# The build time in each VEVENT, left out of the ETag so rebuilds of the same calendar match
+_DTSTAMP_RE = re.compile(rb'DTSTAMP:\d{8}T\d{6}Z')
+
+_MONTHS = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12
+}
+
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_DAY_INDEX = {day_name: index for index, day_name in enumerate(_DAY_NAMES)}
+
+EVENT_SUMMARY = "Lee Valley VeloPark - Road Circuit Open"
+EVENT_DESCRIPTION = "Road cycling circuit is open for sessions and activities. Last entry one hour before closing."
+
+# Constant iCalendar chunks, pre-joined so each is a single entry in the output
+_ICS_HEADER_START = "\r\n".join([
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//Lee Valley VeloPark//Road Cycling Calendar//EN",
+    "CALSCALE:GREGORIAN",
+    "METHOD:PUBLISH"
+])
+_ICS_HEADER_END = "\r\n".join([
+    "X-WR-CALDESC:Lee Valley VeloPark Road Cycling opening hours - Auto-updated from website",
+    "X-WR-TIMEZONE:Europe/London"
+])
+# A whole VEVENT, filled in with str.format so each event is a single string
+_EVENT_TEMPLATE = "\r\n".join([
+    "BEGIN:VEVENT",
+    "UID:velopark-{date}-{start}-{slot_index}@leovalley.org.uk",
+    "DTSTART:{date}T{start}00",
+    "DTEND:{date}T{end}00",
+    "SUMMARY:{summary}",
+    "DESCRIPTION:{description}",
+    "DTSTAMP:{now}",
+    "LOCATION:Lee Valley VeloPark, Abercrombie Road, Queen Elizabeth Olympic Park, London E20 3AB",
+    f"URL:{SCHEDULE_URL}",
+    "END:VEVENT"
+])
+
+# Only the schedule section of the page is turned into a parse tree. While parsing,
+# the strainer sees the whole class attribute as one string, so match the class as
+# a token to keep sections that carry other classes too.
+_SCHEDULE_STRAINER = SoupStrainer(
+    'section', class_=re.compile(r'(^|\s)activity-theme__third-width(\s|$)')
+)
+
+# Shared session so repeated scrapes reuse the keep-alive TLS connection
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
 
 class handler(BaseHTTPRequestHandler):
+    # Buffer the response so the headers and body leave in a single socket write
+    wbufsize = 64 * 1024
+    
     def do_GET(self):
         try:
             # Parse query parameters
@@ -21,43 +126,67 @@ class handler(BaseHTTPRequestHandler):
             format_type = query_params.get('format', ['ics'])[0]
             debug = query_params.get('debug', ['false'])[0].lower() == 'true'
             
-            # Scrape the VeloPark website
-            schedule_data = scrape_velopark_schedule()
+            # Scrape the VeloPark website (or reuse a recent scrape)
+            schedule_data, schedule_version, changed_at = get_schedule()
             
             if debug or format_type == 'debug':
                 # Return detailed debug information
                 debug_info = generate_debug_info(schedule_data, weeks_ahead)
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(debug_info, indent=2, default=str).encode())
+                self._send(200, [('Content-Type', 'application/json')],
+                           json.dumps(debug_info, indent=2, default=str).encode())
             elif format_type == 'json':
                 # Return JSON for debugging
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(schedule_data, indent=2).encode())
+                self._send(200, [('Content-Type', 'application/json')],
+                           json.dumps(schedule_data, indent=2).encode())
             else:
                 # Generate and return iCalendar
-                ics_content = generate_icalendar(schedule_data, calendar_name, include_notes, weeks_ahead)
+                ics_bytes, gzip_bytes, etag = get_icalendar_entry(
+                    schedule_data, schedule_version, calendar_name, include_notes, weeks_ahead
+                )
+                
+                # The repetitive ICS text compresses well; the gzip body gets its own ETag
+                use_gzip = accepts_gzip(self.headers.get('Accept-Encoding', ''))
+                if use_gzip:
+                    body = gzip_bytes
+                    etag = etag[:-1] + '-gzip"'
+                else:
+                    body = ics_bytes
                 
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/calendar; charset=utf-8')
-                self.send_header('Content-Disposition', 'attachment; filename="velopark-schedule.ics"')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(ics_content.encode('utf-8'))
+                validators = [
+                    ('ETag', etag),
+                    ('Last-Modified', format_datetime(changed_at, usegmt=True)),
+                    ('Vary', 'Accept-Encoding'),
+                ]
+                
+                # Calendar clients poll; answer unchanged calendars without a body
+                if is_not_modified(self.headers, etag, changed_at):
+                    self._send(304, validators)
+                    return
+                
+                headers = [
+                    ('Content-Type', 'text/calendar; charset=utf-8'),
+                    ('Content-Disposition', 'attachment; filename="velopark-schedule.ics"'),
+                ]
+                if use_gzip:
+                    headers.append(('Content-Encoding', 'gzip'))
+                self._send(200, headers + validators, body)
                 
         except Exception as e:
             # Return error response
             error_message = f"Error: {str(e)}"
-            self.send_response(500)
-            self.send_header('Content-Type', 'text/plain')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(error_message.encode())
+            self._send(500, [('Content-Type', 'text/plain')], error_message.encode())
+    
+    def _send(self, status, headers, body=None):
+        """Send a complete response; the buffered wfile is flushed once the request finishes"""
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if body is not None:
+            self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        if body is not None:
+            self.wfile.write(body)
 
 def parse_day_time_flexible(text):
     """
@@ -69,44 +198,25 @@ def parse_day_time_flexible(text):
     Returns (day, times) or (None, None) if parsing fails
     """
     # Normalize whitespace first
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Try multiple patterns for day-time separation
-    patterns = [
-        # Pattern 1: "Day - times" (current expected format)
-        r'^([A-Za-z]+)\s*-\s*(.+)$',
-        # Pattern 2: "Day-times" (no space before hyphen)
-        r'^([A-Za-z]+)-\s*(.+)$',
-        # Pattern 3: "Day -times" (no space after hyphen)
-        r'^([A-Za-z]+)\s*-(.+)$',
-    ]
+    text = _WS_RE.sub(' ', text.strip())
     
-    for pattern in patterns:
-        match = re.match(pattern, text)
-        if match:
-            day = match.group(1).strip()
-            times = match.group(2).strip()
-            
-            # Validate day name
-            valid_days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            if day in valid_days:
-                return day, times
+    match = _DAY_TIME_RE.match(text)
+    
+    # Validate day name
+    if match and match[1] in _DAY_INDEX:
+        return match[1], match[2]
     
     return None, None
 
 def scrape_velopark_schedule():
     """Scrape the Lee Valley VeloPark website for opening hours"""
-    url = "https://www.better.org.uk/leisure-centre/lee-valley/velopark/road-cycling"
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session.get(SCHEDULE_URL, headers=_HEADERS, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # lxml (already a dependency) parses in C and is much faster than html.parser;
+        # the strainer skips building tree nodes for everything outside the schedule
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_SCHEDULE_STRAINER)
         
         # Find the schedule section
         schedule_section = soup.find('section', class_='activity-theme__third-width')
@@ -155,39 +265,118 @@ def scrape_velopark_schedule():
     except Exception as e:
         raise Exception(f"Failed to parse schedule: {str(e)}")
 
-def parse_week_date(week_title):
-    """Parse week title like 'Week beginning 26 May' into a date"""
-    match = re.search(r'Week beginning (\d+) (\w+)', week_title, re.IGNORECASE)
+def get_schedule():
+    """
+    Return (schedule_data, schedule_version, changed_at), reusing the scraped
+    schedule for SCHEDULE_CACHE_SECONDS. The version only changes when the content
+    does, and changed_at is when this instance first saw the current content.
+    """
+    global _schedule_cache
+    
+    with _schedule_cache_lock:
+        cached = _schedule_cache
+    
+    if cached and time.monotonic() - cached[0] < SCHEDULE_CACHE_SECONDS:
+        return cached[1:]
+    
+    with _scrape_lock:
+        # Another request may have refreshed the cache while we waited
+        with _schedule_cache_lock:
+            cached = _schedule_cache
+        if cached and time.monotonic() - cached[0] < SCHEDULE_CACHE_SECONDS:
+            return cached[1:]
+        
+        schedule_data = scrape_velopark_schedule()
+        schedule_version = hash(json.dumps(schedule_data, sort_keys=True))
+        
+        # A refresh that finds the same content keeps its original change time
+        if cached and cached[2] == schedule_version:
+            changed_at = cached[3]
+        else:
+            # HTTP dates have one-second resolution
+            changed_at = datetime.now(timezone.utc).replace(microsecond=0)
+        
+        with _schedule_cache_lock:
+            _schedule_cache = (time.monotonic(), schedule_data, schedule_version, changed_at)
+    
+    return schedule_data, schedule_version, changed_at
+
+def get_icalendar_entry(schedule_data, schedule_version, calendar_name, include_notes, weeks_ahead):
+    """
+    Return (ics_bytes, gzip_bytes, etag) for the calendar, generating and compressing
+    it only once per schedule version. The ETag hashes the body without its DTSTAMPs,
+    so every instance gives the same calendar the same ETag.
+    """
+    key = (schedule_version, calendar_name, include_notes, weeks_ahead)
+    
+    entry = _ics_cache.get(key)
+    if entry is None:
+        ics_bytes = generate_icalendar(schedule_data, calendar_name, include_notes, weeks_ahead).encode('utf-8')
+        gzip_bytes = gzip.compress(ics_bytes, compresslevel=6, mtime=0)
+        etag = f'"{hashlib.md5(_DTSTAMP_RE.sub(b"DTSTAMP:", ics_bytes)).hexdigest()}"'
+        entry = (ics_bytes, gzip_bytes, etag)
+        
+        with _ics_cache_lock:
+            # Evict the oldest entry once the cache is full
+            if len(_ics_cache) >= ICS_CACHE_SIZE:
+                _ics_cache.pop(next(iter(_ics_cache)))
+            _ics_cache[key] = entry
+    
+    return entry
+
+def accepts_gzip(accept_encoding):
+    """Check an Accept-Encoding header for gzip, honouring an explicit q=0"""
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        if name.strip().lower() not in ('gzip', 'x-gzip'):
+            continue
+        params = params.replace(' ', '').lower()
+        return params not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+def is_not_modified(request_headers, etag, last_modified):
+    """Check conditional request headers; If-None-Match takes precedence over If-Modified-Since"""
+    if_none_match = request_headers.get('If-None-Match')
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+    
+    if_modified_since = request_headers.get('If-Modified-Since')
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified <= since
+    
+    return False
+
+def parse_week_date(week_title, now=None):
+    """
+    Parse week title like 'Week beginning 26 May' into a date.
+    now is today's date, read from the clock if not given.
+    """
+    # Use the current year when the code is run; it's part of the cache key so a
+    # cached result never outlives the month it was worked out in
+    if now is None:
+        now = datetime.now()
+    return _parse_week_date(week_title, now.year, now.month)
+
+@lru_cache(maxsize=256)
+def _parse_week_date(week_title, year, current_month):
+    """Cached parse_week_date for a given current year and month"""
+    match = _WEEK_RE.search(week_title)
     if not match:
         return None
     
-    day = int(match.group(1))
-    month_name = match.group(2).lower()
-    
-    # Use the current year when the code is run
-    now = datetime.now()
-    year = now.year
-    current_month = now.month
-    
-    months = {
-        'january': 1, 'jan': 1,
-        'february': 2, 'feb': 2,
-        'march': 3, 'mar': 3,
-        'april': 4, 'apr': 4,
-        'may': 5,
-        'june': 6, 'jun': 6,
-        'july': 7, 'jul': 7,
-        'august': 8, 'aug': 8,
-        'september': 9, 'sep': 9,
-        'october': 10, 'oct': 10,
-        'november': 11, 'nov': 11,
-        'december': 12, 'dec': 12
-    }
-    
-    month = months.get(month_name)
+    month = _MONTHS.get(match[2].lower())
     if not month:
         return None
     
+    day = int(match[1])
+    
     # Handle year boundary cases
     if current_month == 12 and month == 1:
         # If it's December and we see a January date, assume it's next year
@@ -203,211 +392,178 @@ def parse_week_date(week_title):
 
 def parse_time_slots(times_str):
     """Parse time strings like '07:00-21:00' or '07:00-14:00 16:00-21:00' or '07:00 - 14:00 and 16:00 - 21:00'"""
-    if 'closed' in times_str.lower():
-        return []
+    return list(_parse_time_slots(times_str))
+
+@lru_cache(maxsize=256)
+def _parse_time_slots(times_str):
+    """
+    Cached parse_time_slots; returns a tuple so the cached value can't be mutated.
+    The HH:MM strings are interned so every day shares one copy of each time.
+    """
+    # "Closed" is the only non-time marker the site uses
+    if times_str == "Closed":
+        return ()
     
-    # Remove content inside parentheses first (these are notes, not actual session times)
-    # This prevents times like "(16:30-17:30 Abercrombie loop only)" from being parsed as sessions
-    cleaned_str = re.sub(r'\([^)]*\)', '', times_str)
+    # Fast path for the most common entry, a single bare range like "07:00-21:00",
+    # checked by position without going through the regex engine. isdecimal accepts
+    # the same characters as \d, unlike isdigit, which also takes superscripts.
+    if (len(times_str) == 11 and times_str[2] == ':' and times_str[5] == '-' and times_str[8] == ':'
+            and (times_str[:2] + times_str[3:5] + times_str[6:8] + times_str[9:]).isdecimal()):
+        return ((sys.intern(times_str[:5]), sys.intern(times_str[6:])),)
     
-    # Normalize the string - replace multiple spaces with single space
-    normalized = re.sub(r'\s+', ' ', cleaned_str.strip())
+    # Fall back to a case-insensitive search for any variation on "Closed"
+    if _CLOSED_RE.search(times_str):
+        return ()
     
-    # Split on common separators: space, "and", comma
-    # This handles formats like:
+    # A single pass picks out every HH:MM-HH:MM range, whatever separates them:
     # "07:00-14:00 16:00-21:00" (space separated)
     # "07:00 - 14:00 and 16:00 - 21:00" (and separated)
     # "07:00-10:00, 11:00-14:00" (comma separated)
-    time_parts = re.split(r'\s+(?:and|&)\s+|\s{2,}|,\s*', normalized)
+    # "07:00-14:0016:00-21:00" (stuck together)
+    if '(' not in times_str:
+        return tuple((sys.intern(start), sys.intern(end)) for start, end in _TIME_RANGE_RE.findall(times_str))
     
+    # Ranges inside parentheses are notes, not actual session times, so track the
+    # bracket depth as we go, however deeply notes are nested. This prevents times
+    # like "(16:30-17:30 Abercrombie loop only)" from being parsed as sessions.
     slots = []
-    for part in time_parts:
-        part = part.strip()
-        if not part:
-            continue
-            
-        # Handle cases where times might be stuck together (e.g., "14:0016:00")
-        # Insert space before a time that follows another time
-        part = re.sub(r'(\d{2}:\d{2})(\d{2}:\d{2})', r'\1 \2', part)
-        
-        # Find all time ranges in format HH:MM-HH:MM with optional spaces around dash
-        time_ranges = re.findall(r'\d{2}:\d{2}\s*-\s*\d{2}:\d{2}', part)
-        
-        for time_range in time_ranges:
-            # Remove all spaces and split on dash
-            clean_range = re.sub(r'\s', '', time_range)
-            if '-' in clean_range:
-                start_time, end_time = clean_range.split('-', 1)
-                
-                # Validate time format (exactly HH:MM)
-                if (re.match(r'^\d{2}:\d{2}$', start_time) and 
-                    re.match(r'^\d{2}:\d{2}$', end_time)):
-                    slots.append((start_time, end_time))
+    depth = 0
+    scanned = 0
+    for match in _TIME_RANGE_RE.finditer(times_str):
+        # Take the brackets since the last range in order, so a stray ")" is
+        # ignored instead of cancelling a later "("
+        for bracket in _BRACKET_RE.findall(times_str, scanned, match.start()):
+            if bracket == '(':
+                depth += 1
+            elif depth:
+                depth -= 1
+        scanned = match.end()
+        if depth == 0:
+            slots.append((sys.intern(match[1]), sys.intern(match[2])))
     
-    return slots
+    return tuple(slots)
+
+@lru_cache(maxsize=256)
+def _ics_time_slots(times_str):
+    """Time slots as compact (HHMM, HHMM) pairs ready to drop into DTSTART/DTEND"""
+    return tuple(
+        (start_time.replace(':', ''), end_time.replace(':', ''))
+        for start_time, end_time in _parse_time_slots(times_str)
+    )
 
+@lru_cache(maxsize=256)
 def extract_special_notes(times_str):
     """Extract special notes like '(Bank Holiday)' or '(Abercrombie loop only)'"""
-    notes = re.findall(r'\([^)]+\)', times_str)
+    # Most days have no notes at all
+    if '(' not in times_str:
+        return ''
+    
+    notes = _NOTES_RE.findall(times_str)
     return ' '.join(notes) if notes else ''
 
-def generate_icalendar(schedule_data, calendar_name, include_notes, weeks_ahead):
-    """Generate iCalendar content from schedule data"""
-    
-    # iCalendar header
-    ics_lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Lee Valley VeloPark//Road Cycling Calendar//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        f"X-WR-CALNAME:{calendar_name}",
-        "X-WR-CALDESC:Lee Valley VeloPark Road Cycling opening hours - Auto-updated from website",
-        "X-WR-TIMEZONE:Europe/London"
-    ]
-    
-    event_count = 0
-    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+def _materialize_events(schedule_data, now=None):
+    """Resolve every scheduled day to a flat list of (week_title, event_date, day_name, times_str)
+
+    This is the one pass over the schedule shared by generate_icalendar and
+    generate_debug_info. Weeks whose title can't be parsed and unknown day
+    names are skipped. now is read once for the whole schedule if not given.
+    """
+    if now is None:
+        now = datetime.now()
     
-    # Process each week in the schedule data (only generate events for weeks with actual data)
+    days = []
     for week_title, week_data in schedule_data.items():
-        week_start_date = parse_week_date(week_title)
+        week_start_date = parse_week_date(week_title, now)
         if not week_start_date:
             continue
         
-        # Only generate events for this specific week (no repetition beyond available data)
+        # Day arithmetic on ordinals avoids building a timedelta for every day
+        week_start_ordinal = week_start_date.toordinal()
         for day_name, times_str in week_data.items():
-            if day_name not in day_names:
+            day_index = _DAY_INDEX.get(day_name)
+            if day_index is None:
                 continue
-            
-            day_index = day_names.index(day_name)
-            event_date = week_start_date + timedelta(days=day_index)
-            
-            # Parse time slots for this day
-            time_slots = parse_time_slots(times_str)
-            special_notes = extract_special_notes(times_str)
-            
-            # Create events for each time slot
-            for slot_index, (start_time, end_time) in enumerate(time_slots):
-                event_count += 1
-                
-                # Format date and time for iCalendar
-                date_str = event_date.strftime('%Y%m%d')
-                start_time_str = start_time.replace(':', '')
-                end_time_str = end_time.replace(':', '')
-                
-                # Create unique ID
-                uid = f"velopark-{date_str}-{start_time_str}-{slot_index}@leovalley.org.uk"
-                
-                # Create summary
-                summary = "Lee Valley VeloPark - Road Circuit Open"
-                if len(time_slots) > 1:
-                    summary += f" (Session {slot_index + 1})"
-                
-                # Create description
-                description = "Road cycling circuit is open for sessions and activities. Last entry one hour before closing."
-                if include_notes and special_notes:
-                    description += f" {special_notes}"
-                
-                # Current timestamp
-                now_str = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
-                
-                # Add event to calendar
-                ics_lines.extend([
-                    "BEGIN:VEVENT",
-                    f"UID:{uid}",
-                    f"DTSTART:{date_str}T{start_time_str}00",
-                    f"DTEND:{date_str}T{end_time_str}00",
-                    f"SUMMARY:{summary}",
-                    f"DESCRIPTION:{description}",
-                    "LOCATION:Lee Valley VeloPark, Abercrombie Road, Queen Elizabeth Olympic Park, London E20 3AB",
-                    "URL:https://www.better.org.uk/leisure-centre/lee-valley/velopark/road-cycling",
-                    f"DTSTAMP:{now_str}",
-                    "END:VEVENT"
-                ])
-    
-    # Close calendar
-    ics_lines.append("END:VCALENDAR")
+            days.append((week_title, datetime.fromordinal(week_start_ordinal + day_index), day_name, times_str))
     
-    return "\r\n".join(ics_lines)
+    return days
 
-def generate_debug_info(schedule_data, weeks_ahead):
-    """Generate detailed debug information for troubleshooting"""
-    debug_info = {
-        "schedule_data": schedule_data,
-        "parsing_results": {},
-        "calendar_events": [],
-        "issues_found": []
-    }
+def generate_icalendar(schedule_data, calendar_name, include_notes, weeks_ahead, events=None, now=None):
+    """Generate iCalendar content from schedule data
+
+    events may be passed in from an earlier _materialize_events(schedule_data) call;
+    now is today's date, used to work out the year of each week.
+    """
+    if events is None:
+        events = _materialize_events(schedule_data, now)
     
-    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    # iCalendar header
+    ics_lines = [
+        _ICS_HEADER_START,
+        f"X-WR-CALNAME:{calendar_name}",
+        _ICS_HEADER_END
+    ]
     
-    # Process each week and show parsing details
-    for week_title, week_data in schedule_data.items():
-        week_start_date = parse_week_date(week_title)
+    event_count = 0
+    
+    # Current timestamp, shared by every event in this calendar
+    stamp = datetime.utcnow()
+    now_str = f"{stamp.year:04d}{stamp.month:02d}{stamp.day:02d}T{stamp.hour:02d}{stamp.minute:02d}{stamp.second:02d}Z"
+    
+    # Walk the flattened schedule in one pass (only weeks with actual data produce events)
+    for _, event_date, day_name, times_str in events:
+        # Format the date for iCalendar once for all of the day's slots
+        date_str = f"{event_date.year:04d}{event_date.month:02d}{event_date.day:02d}"
         
-        debug_info["parsing_results"][week_title] = {
-            "week_start_date": week_start_date,
-            "days": {}
-        }
+        # Parse time slots for this day
+        time_slots = _ics_time_slots(times_str)
+        special_notes = extract_special_notes(times_str)
         
-        if not week_start_date:
-            debug_info["issues_found"].append(f"Could not parse week date: {week_title}")
-            continue
+        # The description only depends on the day, so build it once for all its slots
+        description = EVENT_DESCRIPTION
+        if include_notes and special_notes:
+            description += f" {special_notes}"
+        multiple_sessions = len(time_slots) > 1
         
-        for day_name, times_str in week_data.items():
-            if day_name not in day_names:
-                continue
-            
-            day_index = day_names.index(day_name)
-            event_date = week_start_date + timedelta(days=day_index)
-            
-            # Parse time slots and show details
-            time_slots = parse_time_slots(times_str)
-            special_notes = extract_special_notes(times_str)
+        # Create events for each time slot
+        for slot_index, (start_time_str, end_time_str) in enumerate(time_slots):
+            event_count += 1
             
-            day_debug = {
-                "original_text": times_str,
-                "parsed_slots": time_slots,
-                "special_notes": special_notes,
-                "event_date": event_date,
-                "day_of_week": event_date.strftime('%A')
-            }
+            # Create summary
+            summary = EVENT_SUMMARY
+            if multiple_sessions:
+                summary += f" (Session {slot_index + 1})"
             
-            debug_info["parsing_results"][week_title]["days"][day_name] = day_debug
-            
-            # Check for specific issues
-            if day_name == "Friday" and "07:00-14:00 16:00-21:00" in times_str:
-                if len(time_slots) != 2:
-                    debug_info["issues_found"].append(
-                        f"Friday parsing issue: expected 2 slots, got {len(time_slots)} for '{times_str}'"
-                    )
-            
-            # Generate events for this day
-            for slot_index, (start_time, end_time) in enumerate(time_slots):
-                summary = "Lee Valley VeloPark - Road Circuit Open"
-                if len(time_slots) > 1:
-                    summary += f" (Session {slot_index + 1})"
-                
-                event = {
-                    "date": event_date.strftime('%Y-%m-%d'),
-                    "day_name": day_name,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "summary": summary,
-                    "session_number": slot_index + 1,
-                    "total_sessions": len(time_slots),
-                    "original_text": times_str,
-                    "special_notes": special_notes
-                }
-                
-                debug_info["calendar_events"].append(event)
+            # Add event to calendar
+            ics_lines.append(_EVENT_TEMPLATE.format(
+                date=date_str,
+                start=start_time_str,
+                end=end_time_str,
+                slot_index=slot_index,
+                summary=summary,
+                description=description,
+                now=now_str
+            ))
+    
+    # Close calendar
+    ics_lines.append("END:VCALENDAR")
     
-    # Add summary statistics
-    debug_info["summary"] = {
-        "total_weeks": len(schedule_data),
-        "total_events": len(debug_info["calendar_events"]),
-        "issues_count": len(debug_info["issues_found"])
-    }
+    # Every content line, the last included, ends in CRLF (RFC 5545 section 3.1)
+    return "\r\n".join(ics_lines) + "\r\n"
+
+def generate_debug_info(schedule_data, weeks_ahead, events=None, now=None):
+    """Generate detailed debug information for troubleshooting"""
+    if now is None:
+        now = datetime.now()
+    if events is None:
+        events = _materialize_events(schedule_data, now)
     
-    return debug_info
\ No newline at end of file
+    # Imported on demand so normal calendar requests don't pay for the debug code
+    from api import _debug
+    return _debug.generate_debug_info(
+        schedule_data, weeks_ahead, events, now,
+        parse_week_date=parse_week_date,
+        parse_time_slots=_parse_time_slots,
+        extract_special_notes=extract_special_notes,
+        day_names=_DAY_NAMES,
+        event_summary=EVENT_SUMMARY
+    )
@@ -1,9 +1,118 @@
 # test_calendar.py
 import unittest
+import bisect
 import sys
+import types
 import os
 import re
-from datetime import datetime, timedelta
+import logging
+import gzip
+from datetime import datetime
+
+# Per-day and per-event detail goes to the debug log, which is only shown when
+# asked for, e.g. VERBOSE_TESTS=1; otherwise it is never even formatted
+logger = logging.getLogger(__name__)
+if os.environ.get('VERBOSE_TESTS'):
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
+# Event start dates (YYYYMMDD), matched against the ASCII-encoded calendar
+_DTSTART_RE = re.compile(rb'DTSTART:(\d{8})')
+
+def _event_dates(ics_bytes):
+    """Return the start date of every event in the encoded calendar, in calendar order"""
+    return [
+        datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+        for date_str in _DTSTART_RE.findall(ics_bytes)
+    ]
+
+# Test data from the actual VeloPark website, read-only (weeks and days) so tests can share it safely
+TEST_SCHEDULE_DATA = types.MappingProxyType({
+    week_title: types.MappingProxyType(week_data)
+    for week_title, week_data in {
+        "Week beginning 26 May": {
+            "Monday": "09:00-16:00 (Bank Holiday)",
+            "Tuesday": "07:00-21:00",
+            "Wednesday": "07:00-19:00",
+            "Thursday": "07:00-21:00 (10:00-17:00 Abercrombie loop only)",
+            "Friday": "07:00-14:00 16:00-21:00 (16:30-17:30 Abercrombie loop only)",
+            "Saturday": "14:00-18:00",
+            "Sunday": "Closed"
+        },
+        "Week beginning 2 June": {
+            "Monday": "07:00-21:00",
+            "Tuesday": "07:00-18:30",
+            "Wednesday": "07:00-19:00",
+            "Thursday": "07:00-21:00",
+            "Friday": "07:00-21:00",
+            "Saturday": "07:30-18:00",
+            "Sunday": "14:00-18:00"
+        },
+        "Week beginning 9 June": {
+            "Monday": "07:00-21:00",
+            "Tuesday": "07:00-18:00",
+            "Wednesday": "07:00-19:00",
+            "Thursday": "07:00-21:00",
+            "Friday": "07:00-21:00",
+            "Saturday": "07:30-10:00 16:00-18:00",
+            "Sunday": "07:30-18:00"
+        }
+    }.items()
+})
+
+# Year boundary cases for parse_week_date: (today, week_title, expected_year, description).
+# Frozen as a tuple so it is built once at import
+YEAR_BOUNDARY_CASES = (
+    # December scenarios - January dates should be next year
+    (datetime(2024, 12, 15), "Week beginning 6 January", 2025, "December 2024 → January should be 2025"),
+    (datetime(2024, 12, 31), "Week beginning 1 January", 2025, "December 31 → January should be next year"),
+    (datetime(2024, 12, 1), "Week beginning 13 January", 2025, "Early December → January should be next year"),
+    (datetime(2024, 12, 1), "Week beginning 1 January", 2025, "1 December → 1 January next year"),
+    (datetime(2024, 12, 15), "Week beginning 8 January", 2025, "15 December → 8 January next year"),
+    (datetime(2024, 12, 31), "Week beginning 15 January", 2025, "31 December → 15 January next year"),
+    (datetime(2024, 12, 25), "Week beginning 22 January", 2025, "25 December → 22 January next year"),
+    
+    # January scenarios - December dates should be previous year
+    (datetime(2025, 1, 15), "Week beginning 30 December", 2024, "January 2025 → December should be 2024"),
+    (datetime(2025, 1, 1), "Week beginning 23 December", 2024, "January 1 → December should be previous year"),
+    (datetime(2025, 1, 31), "Week beginning 16 December", 2024, "Late January → December should be previous year"),
+    (datetime(2025, 1, 1), "Week beginning 30 December", 2024, "1 January → 30 December previous year"),
+    (datetime(2025, 1, 15), "Week beginning 23 December", 2024, "15 January → 23 December previous year"),
+    (datetime(2025, 1, 10), "Week beginning 9 December", 2024, "10 January → 9 December previous year"),
+    
+    # Normal cases within the same year
+    (datetime(2025, 5, 15), "Week beginning 26 May", 2025, "May → May should be same year"),
+    (datetime(2025, 6, 1), "Week beginning 2 June", 2025, "June → June should be same year"),
+    (datetime(2025, 11, 15), "Week beginning 3 November", 2025, "November → November should be same year"),
+    
+    # Edge cases - February scenarios (should not trigger cross-year logic)
+    (datetime(2025, 2, 15), "Week beginning 10 February", 2025, "February → February should be same year"),
+    (datetime(2025, 2, 28), "Week beginning 3 March", 2025, "Late February → March should be same year"),
+    
+    # Edge cases - November scenarios (should not trigger cross-year logic)
+    (datetime(2025, 11, 30), "Week beginning 1 December", 2025, "November → December should be same year"),
+    (datetime(2025, 10, 15), "Week beginning 3 November", 2025, "October → November should be same year"),
+    
+    # These should NOT trigger year adjustments
+    (datetime(2025, 3, 15), "Week beginning 10 March", 2025, "March → March"),
+    (datetime(2025, 5, 30), "Week beginning 2 June", 2025, "May → June"),
+    (datetime(2025, 8, 15), "Week beginning 18 August", 2025, "August → August"),
+    (datetime(2025, 11, 25), "Week beginning 1 December", 2025, "November → December"),
+    (datetime(2025, 2, 15), "Week beginning 3 March", 2025, "February → March"),
+    (datetime(2025, 4, 30), "Week beginning 5 May", 2025, "April → May"),
+    
+    # When it's January 1st, December dates should be previous year
+    (datetime(2025, 1, 1), "Week beginning 1 January", 2025, "New Year's Day → January same year"),
+    (datetime(2025, 1, 1), "Week beginning 31 December", 2024, "New Year's Day → December previous year"),
+    
+    # When it's December 31st, January dates should be next year
+    (datetime(2024, 12, 31), "Week beginning 31 December", 2024, "New Year's Eve → December same year"),
+    
+    # Mid-month scenarios
+    (datetime(2025, 1, 15), "Week beginning 15 January", 2025, "Mid January → January same year"),
+    (datetime(2025, 1, 15), "Week beginning 15 December", 2024, "Mid January → December previous year"),
+    (datetime(2024, 12, 15), "Week beginning 15 December", 2024, "Mid December → December same year"),
+    (datetime(2024, 12, 15), "Week beginning 15 January", 2025, "Mid December → January next year"),
+)
 
 # Add the parent directory to the path so we can import from api/
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -16,7 +125,9 @@ try:
         extract_special_notes,
         generate_icalendar,
         generate_debug_info,
-        scrape_velopark_schedule
+        parse_day_time_flexible,
+        scrape_velopark_schedule,
+        _materialize_events
     )
     print("✓ Successfully imported functions from api/calendar.py")
 except ImportError as e:
@@ -58,10 +169,8 @@ class TestParsingFlexibility(unittest.TestCase):
         # Test what happens with current parsing
         print(f"\nTesting current parsing behavior:")
         for format_str in problematic_formats:
-            parts = format_str.split(' - ', 1)
-            if len(parts) >= 2:
-                day = parts[0].strip()
-                times = parts[1].strip()
+            day, times = parse_day_time_flexible(format_str)
+            if day:
                 print(f"  ✓ '{format_str}' → Day: '{day}', Times: '{times}'")
             else:
                 print(f"  ✗ '{format_str}' → FAILED TO PARSE")
@@ -111,7 +220,6 @@ class TestParsingFlexibility(unittest.TestCase):
         print(f"\nCurrent parsing results:")
         for case in complex_cases:
             # Use the new flexible parsing function
-            from api.calendar import parse_day_time_flexible
             day, times = parse_day_time_flexible(case)
             if day and times:
                 slots = parse_time_slots(times)
@@ -144,37 +252,25 @@ class TestParsingFlexibility(unittest.TestCase):
 
 class TestActualCalendarFunctions(unittest.TestCase):
     
-    def setUp(self):
-        """Test data from the actual VeloPark website"""
-        self.test_schedule_data = {
-            "Week beginning 26 May": {
-                "Monday": "09:00-16:00 (Bank Holiday)",
-                "Tuesday": "07:00-21:00",
-                "Wednesday": "07:00-19:00",
-                "Thursday": "07:00-21:00 (10:00-17:00 Abercrombie loop only)",
-                "Friday": "07:00-14:00 16:00-21:00 (16:30-17:30 Abercrombie loop only)",
-                "Saturday": "14:00-18:00",
-                "Sunday": "Closed"
-            },
-            "Week beginning 2 June": {
-                "Monday": "07:00-21:00",
-                "Tuesday": "07:00-18:30",
-                "Wednesday": "07:00-19:00",
-                "Thursday": "07:00-21:00",
-                "Friday": "07:00-21:00",
-                "Saturday": "07:30-18:00",
-                "Sunday": "14:00-18:00"
-            },
-            "Week beginning 9 June": {
-                "Monday": "07:00-21:00",
-                "Tuesday": "07:00-18:00",
-                "Wednesday": "07:00-19:00",
-                "Thursday": "07:00-21:00",
-                "Friday": "07:00-21:00",
-                "Saturday": "07:30-10:00 16:00-18:00",
-                "Sunday": "07:30-18:00"
-            }
-        }
+    test_schedule_data = TEST_SCHEDULE_DATA
+    
+    @classmethod
+    def setUpClass(cls):
+        # Resolve the schedule once and share it between the calendar and debug output
+        cls.events = _materialize_events(cls.test_schedule_data)
+        
+        # generate_icalendar never emits events beyond the weeks in the data, so a single
+        # calendar requested with the largest weeks_ahead serves every test
+        cls.ics_content = generate_icalendar(
+            cls.test_schedule_data, 
+            "Test Calendar", 
+            include_notes=True, 
+            weeks_ahead=20,
+            events=cls.events
+        )
+        # Event dates are extracted once for the date tests; ICS is pure ASCII, so
+        # extraction can run on the bytes directly
+        cls.event_dates = tuple(_event_dates(cls.ics_content.encode('ascii')))
 
     def test_parse_time_slots_friday_issue(self):
         """Test the specific Friday issue using actual function"""
@@ -220,6 +316,26 @@ class TestActualCalendarFunctions(unittest.TestCase):
                 "input": "07:30-10:00 16:00-18:00",
                 "expected_slots": 2,
                 "description": "Saturday with gap"
+            },
+            {
+                "input": "12:00-13:00 (closes early (event) 10:00-11:00)",
+                "expected_slots": 1,
+                "description": "Nested note with time range"
+            },
+            {
+                "input": "07:00-21:00 (16:30-17:30 Abercrombie loop only",
+                "expected_slots": 1,
+                "description": "Unclosed note with time range"
+            },
+            {
+                "input": "07:00-21:00 (a (b (c) x) 10:00-11:00)",
+                "expected_slots": 1,
+                "description": "Two-level nested note with time range"
+            },
+            {
+                "input": "07:00-21:00 (note) ) (10:00-11:00 x",
+                "expected_slots": 1,
+                "description": "Stray closing bracket before a note"
             }
         ]
         
@@ -276,7 +392,7 @@ class TestActualCalendarFunctions(unittest.TestCase):
         
         for week_title, week_data in self.test_schedule_data.items():
             week_date = parse_week_date(week_title)
-            print(f"\n{week_title} (starts {week_date.strftime('%A %d %B %Y') if week_date else 'PARSE ERROR'}):")
+            logger.debug("\n%s (starts %s):", week_title, week_date or 'PARSE ERROR')
             
             if not week_date:
                 issues.append(f"Could not parse week: {week_title}")
@@ -288,9 +404,9 @@ class TestActualCalendarFunctions(unittest.TestCase):
                 
                 total_events += len(slots)
                 
-                print(f"  {day_name:10}: {times_str:45} → {len(slots)} events {slots}")
+                logger.debug("  %-10s: %-45s → %d events %r", day_name, times_str, len(slots), slots)
                 if notes:
-                    print(f"             Notes: {notes}")
+                    logger.debug("             Notes: %s", notes)
                 
                 # Check for specific known issues
                 if day_name == "Friday" and "16:30-17:30" in times_str and len(slots) != 2:
@@ -314,28 +430,29 @@ class TestActualCalendarFunctions(unittest.TestCase):
         print(f"\n=== ICALENDAR GENERATION TEST ===")
         
         try:
-            ics_content = generate_icalendar(
-                self.test_schedule_data, 
-                "Test Calendar", 
-                include_notes=True, 
-                weeks_ahead=4
-            )
+            ics_content = self.ics_content
+            
+            # Walk the calendar once, then check exact lines and property names
+            lines = ics_content.splitlines()
+            line_set = set(lines)
+            property_names = {line.partition(':')[0] for line in lines}
             
             # Basic validation
-            self.assertIn("BEGIN:VCALENDAR", ics_content)
-            self.assertIn("END:VCALENDAR", ics_content)
-            self.assertIn("BEGIN:VEVENT", ics_content)
-            self.assertIn("END:VEVENT", ics_content)
+            self.assertIn("BEGIN:VCALENDAR", line_set)
+            self.assertIn("END:VCALENDAR", line_set)
+            self.assertTrue(ics_content.endswith("END:VCALENDAR\r\n"), "Calendar should end with a CRLF-terminated END:VCALENDAR")
+            self.assertIn("BEGIN:VEVENT", line_set)
+            self.assertIn("END:VEVENT", line_set)
             
             # Count events
-            event_count = ics_content.count("BEGIN:VEVENT")
+            event_count = lines.count("BEGIN:VEVENT")
             print(f"Generated iCalendar with {event_count} events")
             print(f"Calendar length: {len(ics_content)} characters")
             
             # Validate some content
             self.assertIn("Lee Valley VeloPark", ics_content)
-            self.assertIn("DTSTART:", ics_content)
-            self.assertIn("DTEND:", ics_content)
+            self.assertIn("DTSTART", property_names)
+            self.assertIn("DTEND", property_names)
             
             print("✓ iCalendar generation successful")
             
@@ -346,25 +463,9 @@ class TestActualCalendarFunctions(unittest.TestCase):
         """Test that no events are generated beyond the available schedule data"""
         print(f"\n=== NO EVENTS BEYOND AVAILABLE DATA TEST ===")
         
-        # Generate calendar with the actual schedule data
-        ics_content = generate_icalendar(
-            self.test_schedule_data, 
-            "Test Calendar", 
-            include_notes=True, 
-            weeks_ahead=12  # Request 12 weeks but we only have 3 weeks of data
-        )
-        
-        # Extract all DTSTART dates from the calendar
-        dtstart_matches = re.findall(r'DTSTART:(\d{8})', ics_content)
-        event_dates = []
-        
-        for date_str in dtstart_matches:
-            # Parse YYYYMMDD format
-            year = int(date_str[:4])
-            month = int(date_str[4:6])
-            day = int(date_str[6:8])
-            event_date = datetime(year, month, day)
-            event_dates.append(event_date)
+        # Calendar requested for 20 weeks, built once in setUpClass (we only have 3 weeks of data)
+        # All DTSTART dates from the calendar
+        event_dates = self.event_dates
         
         if event_dates:
             earliest_date = min(event_dates)
@@ -397,16 +498,9 @@ class TestActualCalendarFunctions(unittest.TestCase):
         """Test specific date boundaries to ensure no events leak beyond available data"""
         print(f"\n=== SPECIFIC DATE BOUNDARIES TEST ===")
         
-        # Generate calendar events
-        ics_content = generate_icalendar(
-            self.test_schedule_data, 
-            "Test Calendar", 
-            include_notes=True, 
-            weeks_ahead=20  # Request many weeks to test boundary
-        )
-        
-        # Find all event dates
-        dtstart_matches = re.findall(r'DTSTART:(\d{8})', ics_content)
+        # Calendar requested for 20 weeks, built once in setUpClass (we only have 3 weeks of data)
+        # All event dates
+        event_dates = self.event_dates
         
         current_year = datetime.now().year
         prohibited_dates = [
@@ -416,21 +510,13 @@ class TestActualCalendarFunctions(unittest.TestCase):
             datetime(current_year, 7, 1),   # July (definitely beyond data)
         ]
         
-        events_beyond_data = []
+        # Any event on or after the earliest prohibited date is beyond the data
+        min_prohibited = min(prohibited_dates)
+        events_beyond_data = [event_date for event_date in event_dates if event_date >= min_prohibited]
         
-        for date_str in dtstart_matches:
-            year = int(date_str[:4])
-            month = int(date_str[4:6]) 
-            day = int(date_str[6:8])
-            event_date = datetime(year, month, day)
-            
-            for prohibited_date in prohibited_dates:
-                if event_date >= prohibited_date:
-                    events_beyond_data.append(event_date)
-        
-        print(f"Checking for events on or after prohibited dates:")
+        logger.debug("Checking for events on or after prohibited dates:")
         for date in prohibited_dates:
-            print(f"  - {date.strftime('%A %d %B %Y')}")
+            logger.debug("  - %s", date.date())
         
         if events_beyond_data:
             print(f"✗ Found {len(events_beyond_data)} events beyond available data:")
@@ -444,14 +530,7 @@ class TestActualCalendarFunctions(unittest.TestCase):
         """Test that we have complete coverage for the weeks we do have data for"""
         print(f"\n=== WEEK COVERAGE COMPLETENESS TEST ===")
         
-        # Generate calendar
-        ics_content = generate_icalendar(
-            self.test_schedule_data, 
-            "Test Calendar", 
-            include_notes=True, 
-            weeks_ahead=8
-        )
-        
+        # Calendar requested for 20 weeks, built once in setUpClass (we only have 3 weeks of data)
         # Expected weeks and their date ranges (using current year)
         current_year = datetime.now().year
         expected_weeks = [
@@ -460,80 +539,43 @@ class TestActualCalendarFunctions(unittest.TestCase):
             ("Week beginning 9 June", datetime(current_year, 6, 9), datetime(current_year, 6, 15)),
         ]
         
-        # Extract event dates
-        dtstart_matches = re.findall(r'DTSTART:(\d{8})', ics_content)
-        event_dates = set()
+        # Event dates as day ordinals
+        event_ordinals = {event_date.toordinal() for event_date in self.event_dates}
         
-        for date_str in dtstart_matches:
-            year = int(date_str[:4])
-            month = int(date_str[4:6])
-            day = int(date_str[6:8])
-            event_date = datetime(year, month, day)
-            event_dates.add(event_date)
-        
-        # Check each expected week
+        # Check each expected week, only building datetimes for the days that have events
         for week_title, week_start, week_end in expected_weeks:
-            print(f"\nChecking {week_title} ({week_start.strftime('%d %b')} - {week_end.strftime('%d %b')}):")
-            
-            week_events = []
-            current_date = week_start
-            
-            while current_date <= week_end:
-                if current_date in event_dates:
-                    week_events.append(current_date)
-                current_date += timedelta(days=1)
+            week_ordinals = range(week_start.toordinal(), week_end.toordinal() + 1)
+            week_events = [datetime.fromordinal(ordinal) for ordinal in sorted(event_ordinals.intersection(week_ordinals))]
             
-            print(f"  Events found on {len(week_events)} days:")
-            for event_date in week_events:
-                day_name = event_date.strftime('%A')
-                # Get the expected times for this day from test data
-                expected_times = self.test_schedule_data[week_title].get(day_name, "Not found")
-                print(f"    {event_date.strftime('%a %d %b')}: {expected_times}")
+            logger.debug("\nChecking %s (%s - %s):", week_title, week_start.date(), week_end.date())
+            logger.debug("  Events found on %d days:", len(week_events))
+            if logger.isEnabledFor(logging.DEBUG):
+                for event_date in week_events:
+                    day_name = event_date.strftime('%A')
+                    # Get the expected times for this day from test data
+                    expected_times = self.test_schedule_data[week_title].get(day_name, "Not found")
+                    logger.debug("    %s %s: %s", day_name[:3], event_date.date(), expected_times)
             
             # Verify we have events for non-closed days
             week_data = self.test_schedule_data[week_title]
-            expected_event_days = sum(1 for times in week_data.values() if 'closed' not in times.lower())
+            expected_event_days = sum(1 for times in week_data.values() if times != "Closed")
             
             if len(week_events) > 0:
-                print(f"  ✓ Week has {len(week_events)} event days (expected non-closed days: {expected_event_days})")
+                print(f"  ✓ {week_title} has {len(week_events)} event days (expected non-closed days: {expected_event_days})")
             else:
-                print(f"  ✗ No events found for this week!")
+                print(f"  ✗ No events found for {week_title}!")
 
     def test_no_pattern_repetition(self):
         """Test that patterns don't repeat beyond available data"""
         print(f"\n=== NO PATTERN REPETITION TEST ===")
         
-        # Generate calendar with request for many weeks
-        ics_content = generate_icalendar(
-            self.test_schedule_data, 
-            "Test Calendar", 
-            include_notes=True, 
-            weeks_ahead=15  # Request way more weeks than we have data for
-        )
-        
+        # Calendar requested for 20 weeks, built once in setUpClass (we only have 3 weeks of data)
         # Look for events that would indicate pattern repetition
         # For example, if we see events on June 23 (which would be Monday of week 4), 
         # that suggests the pattern is repeating
         
-        # Extract all event lines with dates
-        event_lines = []
-        for line in ics_content.split('\n'):
-            if 'DTSTART:' in line:
-                event_lines.append(line)
-        
-        # Convert to actual dates and check for suspicious patterns
-        event_dates = []
-        for line in event_lines:
-            date_match = re.search(r'DTSTART:(\d{8})', line)
-            if date_match:
-                date_str = date_match.group(1)
-                year = int(date_str[:4])
-                month = int(date_str[4:6])
-                day = int(date_str[6:8])
-                event_dates.append(datetime(year, month, day))
-        
-        # Sort dates
-        event_dates.sort()
+        # Convert event dates and check for suspicious patterns
+        event_dates = sorted(self.event_dates)
         
         # Check for events that would indicate week 4 repetition (June 16-22)
         current_year = datetime.now().year
@@ -544,10 +586,12 @@ class TestActualCalendarFunctions(unittest.TestCase):
         week5_start = datetime(current_year, 6, 23)
         week5_end = datetime(current_year, 6, 29)
         
-        repetition_events = []
-        for event_date in event_dates:
-            if (week4_start <= event_date <= week4_end) or (week5_start <= event_date <= week5_end):
-                repetition_events.append(event_date)
+        # event_dates is sorted, so everything before week 4 can be skipped outright
+        first_candidate = bisect.bisect_left(event_dates, week4_start)
+        repetition_events = [
+            event_date for event_date in event_dates[first_candidate:]
+            if event_date <= week4_end or week5_start <= event_date <= week5_end
+        ]
         
         print(f"Total events generated: {len(event_dates)}")
         if event_dates:
@@ -563,183 +607,23 @@ class TestActualCalendarFunctions(unittest.TestCase):
         else:
             print("✓ No pattern repetition detected")
 
-    def test_year_boundary_edge_cases(self):
-        """Test year boundary logic for December/January transitions"""
-        print(f"\n=== YEAR BOUNDARY EDGE CASES TEST ===")
-        
-        # We need to test the logic by temporarily modifying what the function thinks is "now"
-        # We'll monkey patch datetime.now() to simulate different current dates
-        
-        from unittest.mock import patch
-        
-        test_cases = [
-            # Format: (current_date, week_title, expected_year, description)
-            
-            # December scenarios - January dates should be next year
-            ("2024-12-15", "Week beginning 6 January", 2025, "December 2024 → January should be 2025"),
-            ("2024-12-31", "Week beginning 1 January", 2025, "December 31 → January should be next year"),
-            ("2024-12-01", "Week beginning 13 January", 2025, "Early December → January should be next year"),
-            
-            # January scenarios - December dates should be previous year
-            ("2025-01-15", "Week beginning 30 December", 2024, "January 2025 → December should be 2024"),
-            ("2025-01-01", "Week beginning 23 December", 2024, "January 1 → December should be previous year"),
-            ("2025-01-31", "Week beginning 16 December", 2024, "Late January → December should be previous year"),
-            
-            # Normal cases within the same year
-            ("2025-05-15", "Week beginning 26 May", 2025, "May → May should be same year"),
-            ("2025-06-01", "Week beginning 2 June", 2025, "June → June should be same year"),
-            ("2025-11-15", "Week beginning 3 November", 2025, "November → November should be same year"),
-            
-            # Edge cases - February scenarios (should not trigger cross-year logic)
-            ("2025-02-15", "Week beginning 10 February", 2025, "February → February should be same year"),
-            ("2025-02-28", "Week beginning 3 March", 2025, "Late February → March should be same year"),
-            
-            # Edge cases - November scenarios (should not trigger cross-year logic)
-            ("2025-11-30", "Week beginning 1 December", 2025, "November → December should be same year"),
-            ("2025-10-15", "Week beginning 3 November", 2025, "October → November should be same year"),
-        ]
+    def test_year_boundary(self):
+        """Test year boundary logic for December/January transitions and normal months"""
+        print(f"\n=== YEAR BOUNDARY TEST ===")
         
-        for current_date_str, week_title, expected_year, description in test_cases:
+        # Each case hands parse_week_date its own idea of today's date
+        for current_date, week_title, expected_year, description in YEAR_BOUNDARY_CASES:
             with self.subTest(description):
-                # Parse the mock current date
-                mock_current_date = datetime.strptime(current_date_str, "%Y-%m-%d")
-                
-                # Mock datetime.now() to return our test date
-                with patch('api.calendar.datetime') as mock_datetime:
-                    mock_datetime.now.return_value = mock_current_date
-                    mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-                    
-                    # Test the actual function
-                    result_date = parse_week_date(week_title)
-                    
-                    if result_date:
-                        print(f"{description:50} | Current: {current_date_str} | Week: {week_title:25} | Got year: {result_date.year} | Expected: {expected_year}")
-                        self.assertEqual(result_date.year, expected_year, 
-                            f"Year mismatch for {description}. Current date: {current_date_str}, Week: {week_title}")
-                    else:
-                        self.fail(f"Failed to parse date for {description}: {week_title}")
-
-    def test_year_boundary_specific_months(self):
-        """Test specific month combinations that should trigger year adjustments"""
-        print(f"\n=== SPECIFIC MONTH BOUNDARY TEST ===")
-        
-        from unittest.mock import patch
-        
-        # Test December → January (should increment year)
-        december_to_january_cases = [
-            ("2024-12-01", "Week beginning 1 January", 2025),
-            ("2024-12-15", "Week beginning 8 January", 2025),
-            ("2024-12-31", "Week beginning 15 January", 2025),
-            ("2024-12-25", "Week beginning 22 January", 2025),
-        ]
-        
-        print("Testing December → January transitions:")
-        for current_date_str, week_title, expected_year in december_to_january_cases:
-            mock_current_date = datetime.strptime(current_date_str, "%Y-%m-%d")
-            
-            with patch('api.calendar.datetime') as mock_datetime:
-                mock_datetime.now.return_value = mock_current_date
-                mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-                
-                result_date = parse_week_date(week_title)
-                self.assertIsNotNone(result_date, f"Failed to parse: {week_title}")
-                self.assertEqual(result_date.year, expected_year)
-                print(f"  ✓ {current_date_str} + {week_title} → {result_date.year}")
-        
-        # Test January → December (should decrement year)
-        january_to_december_cases = [
-            ("2025-01-01", "Week beginning 30 December", 2024),
-            ("2025-01-15", "Week beginning 23 December", 2024),
-            ("2025-01-31", "Week beginning 16 December", 2024),
-            ("2025-01-10", "Week beginning 9 December", 2024),
-        ]
-        
-        print("\nTesting January → December transitions:")
-        for current_date_str, week_title, expected_year in january_to_december_cases:
-            mock_current_date = datetime.strptime(current_date_str, "%Y-%m-%d")
-            
-            with patch('api.calendar.datetime') as mock_datetime:
-                mock_datetime.now.return_value = mock_current_date
-                mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-                
-                result_date = parse_week_date(week_title)
+                result_date = parse_week_date(week_title, now=current_date)
                 self.assertIsNotNone(result_date, f"Failed to parse: {week_title}")
-                self.assertEqual(result_date.year, expected_year)
-                print(f"  ✓ {current_date_str} + {week_title} → {result_date.year}")
-
-    def test_year_boundary_no_false_positives(self):
-        """Test that normal month transitions don't trigger year changes"""
-        print(f"\n=== NO FALSE POSITIVES TEST ===")
-        
-        from unittest.mock import patch
-        
-        # These should NOT trigger year adjustments
-        normal_cases = [
-            ("2025-03-15", "Week beginning 10 March", 2025, "March → March"),
-            ("2025-05-30", "Week beginning 2 June", 2025, "May → June"),
-            ("2025-08-15", "Week beginning 18 August", 2025, "August → August"),
-            ("2025-10-15", "Week beginning 3 November", 2025, "October → November"),
-            ("2025-11-25", "Week beginning 1 December", 2025, "November → December"),
-            ("2025-02-15", "Week beginning 3 March", 2025, "February → March"),
-            ("2025-04-30", "Week beginning 5 May", 2025, "April → May"),
-        ]
-        
-        for current_date_str, week_title, expected_year, description in normal_cases:
-            with self.subTest(description):
-                mock_current_date = datetime.strptime(current_date_str, "%Y-%m-%d")
-                
-                with patch('api.calendar.datetime') as mock_datetime:
-                    mock_datetime.now.return_value = mock_current_date
-                    mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-                    
-                    result_date = parse_week_date(week_title)
-                    self.assertIsNotNone(result_date, f"Failed to parse: {week_title}")
-                    self.assertEqual(result_date.year, expected_year)
-                    print(f"  ✓ {description:20} | {current_date_str} + {week_title} → {result_date.year} (correct)")
-
-    def test_year_boundary_edge_case_validation(self):
-        """Test edge cases around the exact boundary dates"""
-        print(f"\n=== YEAR BOUNDARY EDGE CASE VALIDATION ===")
-        
-        from unittest.mock import patch
-        
-        # Test various January dates in different contexts
-        edge_cases = [
-            # When it's January 1st, December dates should be previous year
-            ("2025-01-01", "Week beginning 1 January", 2025, "New Year's Day → January same year"),
-            ("2025-01-01", "Week beginning 31 December", 2024, "New Year's Day → December previous year"),
-            
-            # When it's December 31st, January dates should be next year  
-            ("2024-12-31", "Week beginning 31 December", 2024, "New Year's Eve → December same year"),
-            ("2024-12-31", "Week beginning 1 January", 2025, "New Year's Eve → January next year"),
-            
-            # Mid-month scenarios
-            ("2025-01-15", "Week beginning 15 January", 2025, "Mid January → January same year"),
-            ("2025-01-15", "Week beginning 15 December", 2024, "Mid January → December previous year"),
-            ("2024-12-15", "Week beginning 15 December", 2024, "Mid December → December same year"),
-            ("2024-12-15", "Week beginning 15 January", 2025, "Mid December → January next year"),
-        ]
-        
-        for current_date_str, week_title, expected_year, description in edge_cases:
-            with self.subTest(description):
-                mock_current_date = datetime.strptime(current_date_str, "%Y-%m-%d")
-                
-                with patch('api.calendar.datetime') as mock_datetime:
-                    mock_datetime.now.return_value = mock_current_date
-                    mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-                    
-                    result_date = parse_week_date(week_title)
-                    self.assertIsNotNone(result_date, f"Failed to parse: {week_title}")
-                    self.assertEqual(result_date.year, expected_year, 
-                        f"Wrong year for {description}. Expected {expected_year}, got {result_date.year}")
-                    print(f"  ✓ {description}")
+                self.assertEqual(result_date.year, expected_year, 
+                    f"Year mismatch for {description}. Current date: {current_date.date()}, Week: {week_title}")
+                print(f"  ✓ {description:50} | {current_date.date()} + {week_title} → {result_date.year}")
 
     def test_real_world_scenarios(self):
         """Test real-world scenarios that might occur"""
         print(f"\n=== REAL WORLD SCENARIOS TEST ===")
         
-        from unittest.mock import patch
-        
         # Realistic scenarios that could happen in practice
         real_scenarios = [
             # Gym publishes next week's schedule in December
@@ -757,23 +641,30 @@ class TestActualCalendarFunctions(unittest.TestCase):
         
         for current_date_str, week_title, expected_year, description in real_scenarios:
             with self.subTest(description):
-                mock_current_date = datetime.strptime(current_date_str, "%Y-%m-%d")
+                current_date = datetime.fromisoformat(current_date_str)
                 
-                with patch('api.calendar.datetime') as mock_datetime:
-                    mock_datetime.now.return_value = mock_current_date
-                    mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-                    
-                    result_date = parse_week_date(week_title)
-                    self.assertIsNotNone(result_date, f"Failed to parse: {week_title}")
-                    self.assertEqual(result_date.year, expected_year)
-                    print(f"  ✓ {description}")
-                    print(f"    Current: {current_date_str}, Week: {week_title} → {result_date.strftime('%Y-%m-%d (%A)')}")
+                result_date = parse_week_date(week_title, now=current_date)
+                self.assertIsNotNone(result_date, f"Failed to parse: {week_title}")
+                self.assertEqual(result_date.year, expected_year)
+                print(f"  ✓ {description}")
+                print(f"    Current: {current_date_str}, Week: {week_title} → {result_date.strftime('%Y-%m-%d (%A)')}")
+
+    def test_now_passed_through_calendar_generation(self):
+        """Test that generate_icalendar and generate_debug_info resolve week years against the given now"""
+        schedule = {"Week beginning 6 January": {"Monday": "07:00-21:00"}}
+        december = datetime(2024, 12, 20)
+        
+        ics_content = generate_icalendar(schedule, "Test Calendar", include_notes=True, weeks_ahead=4, now=december)
+        self.assertIn("DTSTART:20250106T070000", ics_content)
+        
+        debug_info = generate_debug_info(schedule, weeks_ahead=4, now=december)
+        self.assertEqual([event["date"] for event in debug_info["calendar_events"]], ["2025-01-06"])
 
     def test_debug_info_boundaries(self):
         """Test that debug info correctly shows boundaries"""
         print(f"\n=== DEBUG INFO BOUNDARIES TEST ===")
         
-        debug_info = generate_debug_info(self.test_schedule_data, weeks_ahead=10)
+        debug_info = generate_debug_info(self.test_schedule_data, weeks_ahead=10, events=self.events)
         
         # Check that calendar events are within expected bounds
         calendar_events = debug_info.get("calendar_events", [])
@@ -786,7 +677,7 @@ class TestActualCalendarFunctions(unittest.TestCase):
         for event in calendar_events:
             event_date_str = event.get("date")
             if event_date_str:
-                event_date = datetime.strptime(event_date_str, '%Y-%m-%d')
+                event_date = datetime.fromisoformat(event_date_str)
                 event_dates.append(event_date)
         
         if event_dates:
@@ -806,6 +697,33 @@ class TestActualCalendarFunctions(unittest.TestCase):
         else:
             self.fail("No valid event dates found in debug info")
 
+    def test_debug_info_does_not_reload_calendar_module(self):
+        """Test that the debug path works when calendar.py is loaded by file path, as Vercel does"""
+        import importlib.util
+        from unittest.mock import patch
+        
+        calendar_path = os.path.join(os.path.dirname(__file__), '..', 'api', 'calendar.py')
+        calendar_path = os.path.abspath(calendar_path)
+        
+        # Start without the api package or its modules loaded; patch.dict restores sys.modules afterwards
+        with patch.dict(sys.modules):
+            for name in ('api', 'api.calendar', 'api._debug'):
+                sys.modules.pop(name, None)
+            
+            # Deliberately not registered in sys.modules, so nothing can look it up by name
+            spec = importlib.util.spec_from_file_location("vc_handler", calendar_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            
+            debug_info = module.generate_debug_info(self.test_schedule_data, weeks_ahead=10)
+            self.assertTrue(debug_info["calendar_events"])
+            
+            calendar_copies = [
+                name for name, loaded in list(sys.modules.items())
+                if os.path.abspath(getattr(loaded, '__file__', None) or '') == calendar_path
+            ]
+            self.assertEqual(calendar_copies, [], "Debug path imported a second copy of the calendar module")
+
     def test_year_boundary_simple(self):
         """Simple test for year boundary logic without mocking (current behavior)"""
         print(f"\n=== SIMPLE YEAR BOUNDARY TEST (Current Implementation) ===")
@@ -853,6 +771,24 @@ class TestActualCalendarFunctions(unittest.TestCase):
             else:
                 print(f"{description:20}: {week_title:25} → FAILED TO PARSE")
 
+    @unittest.skipUnless(os.environ.get('RUN_LIVE_TESTS') == '1', 'live network test disabled; set RUN_LIVE_TESTS=1 to enable')
+    def test_live_website_scraping(self):
+        """Test scraping the real VeloPark website (needs network access, so opt-in)"""
+        print(f"\n=== LIVE WEBSITE SCRAPING TEST ===")
+        
+        try:
+            schedule_data = scrape_velopark_schedule()
+        except Exception as e:
+            # The site may be down or between timetables
+            self.skipTest(f"Could not scrape the live website ({e}) - this may be normal")
+        
+        print(f"Scraped {len(schedule_data)} weeks")
+        for week_title, week_data in schedule_data.items():
+            with self.subTest(week_title):
+                self.assertIsNotNone(parse_week_date(week_title), f"Failed to parse: {week_title}")
+                for day_name, times_str in week_data.items():
+                    logger.debug("  %-25s %-10s: %s → %r", week_title, day_name, times_str, parse_time_slots(times_str))
+
 class TestFlexibleParsingImplementation(unittest.TestCase):
     """Test the new flexible parsing implementation"""
     
@@ -860,9 +796,6 @@ class TestFlexibleParsingImplementation(unittest.TestCase):
         """Test the new flexible day-time parsing function"""
         print(f"\n=== FLEXIBLE DAY-TIME PARSING TESTS ===")
         
-        # Import the new function
-        from api.calendar import parse_day_time_flexible
-        
         test_cases = [
             ("Monday - 07:00- 21:00", "Monday", "07:00- 21:00"),
             ("Tuesday - 16:00 - 21:00", "Tuesday", "16:00 - 21:00"),
@@ -910,6 +843,11 @@ class TestFlexibleParsingImplementation(unittest.TestCase):
             ("07:00- 21:00", [("07:00", "21:00")]),
             ("07:30- 18:00", [("07:30", "18:00")]),
             ("07:30 - 18:00", [("07:30", "18:00")]),
+            # Other separators
+            ("07:00-10:00, 11:00-14:00", [("07:00", "10:00"), ("11:00", "14:00")]),
+            ("07:00-14:0016:00-21:00", [("07:00", "14:00"), ("16:00", "21:00")]),
+            # Range-shaped but not all decimal digits, so not a time
+            ("0²:00-21:00", []),
         ]
         
         for input_str, expected_slots in test_cases:
@@ -922,8 +860,6 @@ class TestFlexibleParsingImplementation(unittest.TestCase):
         """Test the complete integration with the problematic formats from your example"""
         print(f"\n=== INTEGRATION TEST WITH PROBLEMATIC FORMATS ===")
         
-        from api.calendar import parse_day_time_flexible
-        
         # Your example data
         problematic_formats = [
             "Monday - 07:00- 21:00",
@@ -958,6 +894,223 @@ class TestFlexibleParsingImplementation(unittest.TestCase):
                 
                 print(f"  ✓ '{input_str}' → Day: '{day}', Slots: {slots}")
 
+class TestScheduleCache(unittest.TestCase):
+    """Test that repeated requests reuse the scraped schedule"""
+    
+    def setUp(self):
+        import api.calendar
+        self.calendar_module = api.calendar
+        self.calendar_module._schedule_cache = None
+        self.calendar_module._ics_cache.clear()
+    
+    def tearDown(self):
+        self.calendar_module._schedule_cache = None
+        self.calendar_module._ics_cache.clear()
+    
+    def test_schedule_reused_within_cache_window(self):
+        """Test that a second call inside the window does not scrape again"""
+        from unittest.mock import patch
+        
+        schedule = {"Week beginning 2 June": {"Monday": "07:00-21:00"}}
+        
+        with patch('api.calendar.scrape_velopark_schedule', return_value=schedule) as mock_scrape:
+            first, first_version, _ = self.calendar_module.get_schedule()
+            second, second_version, _ = self.calendar_module.get_schedule()
+        
+        self.assertEqual(mock_scrape.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(first_version, second_version)
+    
+    def test_schedule_refreshed_after_cache_window(self):
+        """Test that an expired cache entry triggers a fresh scrape"""
+        from unittest.mock import patch
+        
+        schedule = {"Week beginning 2 June": {"Monday": "07:00-21:00"}}
+        
+        with patch('api.calendar.scrape_velopark_schedule', return_value=schedule) as mock_scrape:
+            self.calendar_module.get_schedule()
+            fetched_at, data, version, changed_at = self.calendar_module._schedule_cache
+            self.calendar_module._schedule_cache = (
+                fetched_at - self.calendar_module.SCHEDULE_CACHE_SECONDS, data, version, changed_at
+            )
+            self.calendar_module.get_schedule()
+        
+        self.assertEqual(mock_scrape.call_count, 2)
+    
+    def test_change_time_kept_while_content_unchanged(self):
+        """Test that Last-Modified only moves when a refresh finds different content"""
+        from datetime import timezone
+        from unittest.mock import patch
+        
+        schedule = {"Week beginning 2 June": {"Monday": "07:00-21:00"}}
+        changed_schedule = {"Week beginning 2 June": {"Monday": "07:00-19:00"}}
+        
+        def expire_and_backdate():
+            fetched_at, data, version, _ = self.calendar_module._schedule_cache
+            self.calendar_module._schedule_cache = (
+                fetched_at - self.calendar_module.SCHEDULE_CACHE_SECONDS, data, version,
+                datetime(2025, 6, 1, tzinfo=timezone.utc)
+            )
+        
+        with patch('api.calendar.scrape_velopark_schedule', side_effect=[schedule, dict(schedule), changed_schedule]):
+            self.calendar_module.get_schedule()
+            expire_and_backdate()
+            _, _, unchanged_at = self.calendar_module.get_schedule()
+            expire_and_backdate()
+            _, _, changed_at = self.calendar_module.get_schedule()
+        
+        self.assertEqual(unchanged_at, datetime(2025, 6, 1, tzinfo=timezone.utc))
+        self.assertGreater(changed_at, unchanged_at)
+    
+    def test_concurrent_misses_share_one_scrape(self):
+        """Test that requests arriving during a scrape wait for its result"""
+        import threading
+        import time
+        from unittest.mock import patch
+        
+        schedule = {"Week beginning 2 June": {"Monday": "07:00-21:00"}}
+        
+        def slow_scrape():
+            time.sleep(0.05)
+            return schedule
+        
+        results = []
+        with patch('api.calendar.scrape_velopark_schedule', side_effect=slow_scrape) as mock_scrape:
+            threads = [
+                threading.Thread(target=lambda: results.append(self.calendar_module.get_schedule()))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(mock_scrape.call_count, 1)
+        self.assertEqual(len(results), 4)
+    
+    def test_icalendar_entry_cached_per_version(self):
+        """Test that the encoded calendar is only generated once per schedule version"""
+        from unittest.mock import patch
+        
+        schedule = {"Week beginning 2 June": {"Monday": "07:00-21:00"}}
+        
+        with patch('api.calendar.generate_icalendar', return_value="BEGIN:VCALENDAR") as mock_generate:
+            first = self.calendar_module.get_icalendar_entry(schedule, 1, "Test", True, 8)
+            second = self.calendar_module.get_icalendar_entry(schedule, 1, "Test", True, 8)
+            self.calendar_module.get_icalendar_entry(schedule, 2, "Test", True, 8)
+        
+        self.assertEqual(first[0], b"BEGIN:VCALENDAR")
+        self.assertEqual(gzip.decompress(first[1]), b"BEGIN:VCALENDAR")
+        self.assertIs(first, second)
+        self.assertEqual(mock_generate.call_count, 2)
+    
+    def test_etag_ignores_build_time(self):
+        """Test that rebuilding an unchanged calendar, as a cold instance would, keeps its ETag"""
+        from unittest.mock import patch
+        
+        schedule = {"Week beginning 2 June": {"Monday": "07:00-21:00"}}
+        bodies = [
+            "BEGIN:VEVENT\r\nDTSTAMP:20250602T120000Z\r\nEND:VEVENT",
+            "BEGIN:VEVENT\r\nDTSTAMP:20250602T121500Z\r\nEND:VEVENT",
+            "BEGIN:VEVENT\r\nSUMMARY:Changed\r\nDTSTAMP:20250602T121500Z\r\nEND:VEVENT",
+        ]
+        
+        etags = []
+        with patch('api.calendar.generate_icalendar', side_effect=bodies):
+            for _ in bodies:
+                self.calendar_module._ics_cache.clear()
+                etags.append(self.calendar_module.get_icalendar_entry(schedule, 1, "Test", True, 8)[2])
+        
+        self.assertEqual(etags[0], etags[1])
+        self.assertNotEqual(etags[1], etags[2])
+
+class TestConditionalRequests(unittest.TestCase):
+    """Test If-None-Match / If-Modified-Since handling for polling calendar clients"""
+    
+    def setUp(self):
+        from datetime import timezone
+        from api.calendar import is_not_modified
+        self.is_not_modified = is_not_modified
+        self.etag = '"abc123"'
+        self.last_modified = datetime(2025, 6, 2, 12, 0, 0, tzinfo=timezone.utc)
+    
+    def test_matching_etag(self):
+        """Test that a matching or wildcard ETag is not modified"""
+        for header in ['"abc123"', '"other", "abc123"', 'W/"abc123"', '*']:
+            with self.subTest(header):
+                self.assertTrue(self.is_not_modified({'If-None-Match': header}, self.etag, self.last_modified))
+    
+    def test_mismatched_etag_wins_over_date(self):
+        """Test that If-None-Match takes precedence over If-Modified-Since"""
+        headers = {
+            'If-None-Match': '"stale"',
+            'If-Modified-Since': 'Mon, 02 Jun 2025 13:00:00 GMT',
+        }
+        self.assertFalse(self.is_not_modified(headers, self.etag, self.last_modified))
+    
+    def test_if_modified_since(self):
+        """Test If-Modified-Since comparisons against the last build time"""
+        test_cases = [
+            ('Mon, 02 Jun 2025 12:00:00 GMT', True),
+            ('Mon, 02 Jun 2025 13:00:00 GMT', True),
+            ('Mon, 02 Jun 2025 11:59:59 GMT', False),
+            ('not a date', False),
+        ]
+        for header, expected in test_cases:
+            with self.subTest(header):
+                self.assertEqual(
+                    self.is_not_modified({'If-Modified-Since': header}, self.etag, self.last_modified),
+                    expected
+                )
+    
+    def test_unconditional_request(self):
+        """Test that a request without validators is always served"""
+        self.assertFalse(self.is_not_modified({}, self.etag, self.last_modified))
+    
+    def test_accepts_gzip(self):
+        """Test Accept-Encoding negotiation for compressed calendars"""
+        from api.calendar import accepts_gzip
+        
+        test_cases = [
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, gzip;q=0.8", True),
+            ("GZIP", True),
+            ("gzip;q=0", False),
+            ("deflate, br", False),
+            ("", False),
+        ]
+        for header, expected in test_cases:
+            with self.subTest(header):
+                self.assertEqual(accepts_gzip(header), expected)
+
+class TestScrapeSchedule(unittest.TestCase):
+    """Test scraping against a saved copy of the schedule page, without the network"""
+    
+    def setUp(self):
+        fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures', 'schedule_page.html')
+        with open(fixture_path, 'rb') as fixture:
+            self.page = fixture.read()
+    
+    def test_scrape_saved_page(self):
+        """Test that the schedule section is found even with extra classes, and nothing outside it is read"""
+        from unittest.mock import Mock, patch
+        import api.calendar
+        
+        with patch.object(api.calendar._session, 'get', return_value=Mock(content=self.page)):
+            schedule = api.calendar.scrape_velopark_schedule()
+        
+        self.assertEqual(schedule, {
+            "Week beginning 26 May": {
+                "Monday": "09:00-16:00 (Bank Holiday)",
+                "Tuesday": "07:00-21:00",
+                "Sunday": "Closed"
+            },
+            "Week beginning 2 June": {
+                "Monday": "07:00-21:00",
+                "Friday": "07:00-14:00 16:00-21:00 (16:30-17:30 Abercrombie loop only)"
+            }
+        })
+
 if __name__ == "__main__":
     print("Testing actual functions from api/calendar.py")
     print("=" * 60)